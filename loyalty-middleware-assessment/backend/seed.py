@@ -14,7 +14,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from django.db import connection, transaction
+
 from tenants.models import Tenant
+from tenants.utils.cache import bump_tenant_list_version
+
+# Rows per INSERT ... ON DUPLICATE KEY UPDATE statement as the tenant list grows
+SEED_BATCH_SIZE = 500
+
+# Columns refreshed on existing tenants when the seed is re-run
+TENANT_UPDATE_FIELDS = ["name", "auth_method", "base_url", "rate_limit_per_minute", "config", "updated_at"]
 
 
 def seed_tenants() -> None:
@@ -25,7 +34,9 @@ def seed_tenants() -> None:
     and FintechApp. Each tenant has its own authentication method, rate limit, and config
     dictionary.
 
-    It uses Django's `update_or_create()` to ensure idempotency (safe to run multiple times).
+    All tenants are upserted with `bulk_create(update_conflicts=True)` keyed on the
+    unique `slug`, in batches of `SEED_BATCH_SIZE` rows inside one transaction, so the
+    seed stays idempotent (safe to run multiple times) and commits once.
 
     Environment Variables:
         - COFFEECHAIN_API_URL
@@ -85,13 +96,27 @@ def seed_tenants() -> None:
         },
     ]
 
-    # Loop through each tenant and create or update based on slug
-    for data in tenants:
-        tenant, created = Tenant.objects.update_or_create(slug=data["slug"], defaults=data)
-        if created:
-            logger.info(f"Created tenant: {tenant.slug}")
-        else:
-            logger.info(f"Updated tenant: {tenant.slug}")
+    objs = [Tenant(**data) for data in tenants]
+    slugs = [obj.slug for obj in objs]
+
+    # MySQL upserts on any unique key and rejects an explicit conflict target
+    unique_fields = ["slug"] if connection.features.supports_update_conflicts_with_target else None
+
+    with transaction.atomic():
+        existing = set(Tenant.objects.filter(slug__in=slugs).values_list("slug", flat=True))
+        Tenant.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=TENANT_UPDATE_FIELDS,
+            batch_size=SEED_BATCH_SIZE,
+        )
+        # bulk_create skips post_save, so bump the tenant-list version here. With the
+        # per-process LocMemCache this only reaches the seed process; running servers
+        # serve the old list until their cached body expires (the cache's TIMEOUT).
+        transaction.on_commit(bump_tenant_list_version)
+
+    logger.info(f"Created {len(slugs) - len(existing)} tenant(s), updated {len(existing)} tenant(s).")
 
     logger.info("Tenant seeding complete.")
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TenantsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tenants"
+
+    def ready(self) -> None:
+        # Register signal handlers (tenant list cache invalidation)
+        from tenants import signals  # noqa: F401
@@ -1,44 +1,101 @@
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework import status
+import hashlib
+
+import orjson
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.views import View
 
 from tenants.models import Tenant
-from tenants.serializers import TenantSerializer
-from utils.rfc7807 import missing_tenant_header_error
+from tenants.utils.cache import tenant_list_cache_key
+from utils.error_types import INTERNAL_ERROR, MISSING_TENANT_HEADER
+from utils.rfc7807 import build_problem_response
+
+# Columns exposed by the tenant list; mirrors `TenantSerializer.Meta.fields`
+TENANT_LIST_FIELDS = ("id", "name", "slug", "config", "created_at", "updated_at")
 
 
-class TenantListHandler(APIView):
+class TenantListHandler(View):
     """
     API endpoint to list all registered tenants and their configurations.
 
     This endpoint returns metadata and config values for each known tenant.
+    The rendered JSON body is cached per tenant-list version and invalidated
+    whenever a tenant is saved or deleted. Responses carry an `ETag`, so
+    polling clients sending `If-None-Match` get `304 Not Modified`.
+
+    This is a plain Django view rather than a DRF `APIView`: the endpoint always
+    returns JSON, so content negotiation, renderers and throttling are skipped.
+    As a consequence drf_yasg no longer lists it in the Swagger schema.
 
     Authentication:
         None (open for admin/dev debugging)
 
     Returns:
         200 OK: List of tenants with their metadata and config.
+        304 Not Modified: The client's cached copy is current.
+        405 Method Not Allowed: Any method other than GET/HEAD/OPTIONS.
     """
 
-    def get(self, request):
+    def http_method_not_allowed(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Return the RFC 7807 405 body DRF views produce, instead of Django's empty one.
+
+        Type and detail match `rfc7807_exception_handler`'s output for DRF's
+        `MethodNotAllowed`, so clients see the same shape across the API.
+        """
+        response = build_problem_response(
+            type_=INTERNAL_ERROR,
+            title="Method Not Allowed",
+            status=405,
+            detail=f'Method "{request.method}" not allowed.',
+            instance=request.path,
+            use_drf=False,
+        )
+        response["Allow"] = ", ".join(self._allowed_methods())
+        return response
+
+    def get(self, request: HttpRequest) -> HttpResponse:
         """
         Handle GET request for listing all tenant configurations.
 
         Requires 'X-Internal-Access: true' header for security.
 
+        The endpoint is read-only, so rows are pulled straight from the database
+        as dictionaries and rendered once; subsequent requests are served from
+        the cache without touching the database.
+
         Args:
-            request (Request): DRF request object.
+            request (HttpRequest): Django request object.
 
         Returns:
-            Response: Serialized list of tenants with config details.
+            HttpResponse: JSON list of tenants with config details, 304 if the
+            `If-None-Match` ETag still matches, or an RFC 7807 400 error if the
+            internal access header is missing.
         """
         internal_header = request.headers.get("X-Internal-Access")
         if internal_header != "true":
-            return missing_tenant_header_error(
+            return build_problem_response(
+                type_=MISSING_TENANT_HEADER,
+                title="Missing Tenant ID",
+                status=400,
                 detail="Missing or invalid internal access header.",
                 instance=request.path,
+                use_drf=False,
             )
 
-        tenants = Tenant.objects.all()
-        serializer = TenantSerializer(tenants, many=True)
-        return Response({"data": serializer.data}, status=status.HTTP_200_OK)
+        cache_key = tenant_list_cache_key()
+        cached = cache.get(cache_key)
+        if cached is None:
+            data = list(Tenant.objects.values(*TENANT_LIST_FIELDS))
+            # OPT_UTC_Z keeps DRF's "...Z" datetime format
+            body = orjson.dumps({"data": data}, option=orjson.OPT_UTC_Z)
+            # Content-derived, so the ETag is stable across processes
+            etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+            cached = (body, etag)
+            cache.set(cache_key, cached)
+
+        body, etag = cached
+        response = HttpResponse(body, status=200, content_type="application/json")
+        response["ETag"] = etag
+        return get_conditional_response(request, etag=etag, response=response)
@@ -1,4 +1,8 @@
 from django.db import models
+from django.utils.functional import cached_property
+
+from tenants.utils.auth_headers import AuthHeaderBuilder, make_auth_header_builder
+from tenants.utils.config import TenantConfig
 
 
 class Tenant(models.Model):
@@ -51,13 +55,25 @@ class Tenant(models.Model):
     def __str__(self):
         return self.name
 
+    @cached_property
+    def parsed_config(self) -> TenantConfig:
+        """
+        Returns the well-known config keys parsed once into a `TenantConfig`.
+
+        Cached per instance; re-fetch the tenant after changing `config`.
+
+        Returns:
+            TenantConfig: Typed view over `config`.
+        """
+        return TenantConfig.from_dict(self.config)
+
     def get_currency(self) -> str:
         """Returns the loyalty currency used by the tenant."""
-        return self.config.get("currency")
+        return self.parsed_config.currency
 
     def get_usd_rate(self) -> float:
         """Returns the exchange rate from loyalty currency to USD."""
-        return float(self.config.get("currency_to_usd", 1.0))
+        return float(self.parsed_config.currency_to_usd)
 
     def requires_approval(self, amount: float) -> bool:
         """
@@ -69,7 +85,7 @@ class Tenant(models.Model):
         Returns:
             bool: True if approval is required, False otherwise.
         """
-        threshold = self.config.get("approval_threshold")
+        threshold = self.parsed_config.approval_threshold
         return threshold is not None and amount > threshold
 
     def is_valid_cabin_class(self, cabin: str) -> bool:
@@ -85,7 +101,7 @@ class Tenant(models.Model):
         Returns:
             bool: Whether the cabin class is allowed.
         """
-        allowed = self.config.get("allowed_cabin_class")
+        allowed = self.parsed_config.allowed_cabin_class
         if not cabin:
             return False
         return allowed is None or cabin.lower() == allowed.lower()
@@ -97,7 +113,7 @@ class Tenant(models.Model):
         Returns:
             str: Header key (e.g., 'X-CC-Member-ID')
         """
-        return self.config.get("id_header")
+        return self.parsed_config.id_header
 
     def get_auth_header(self) -> str:
         """
@@ -106,7 +122,20 @@ class Tenant(models.Model):
         Returns:
             str: Header key (e.g., 'X-CC-API-Key') or None
         """
-        return self.config.get("auth_header")
+        return self.parsed_config.auth_header
+
+    @cached_property
+    def auth_header_builder(self) -> AuthHeaderBuilder:
+        """
+        Returns a callable that builds outbound auth headers for this tenant.
+
+        The builder is created once per instance with the tenant's config already
+        bound, so each outbound call is a single function call.
+
+        Returns:
+            AuthHeaderBuilder: Callable taking `(member_id, token)` and returning headers.
+        """
+        return make_auth_header_builder(self.slug, self.config)
 
     def get_cashback_rate(self) -> float:
         """
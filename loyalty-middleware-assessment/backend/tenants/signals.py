@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tenants.models import Tenant
+from tenants.utils.cache import bump_tenant_list_version
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_list_cache(sender, **kwargs) -> None:
+    """Drops the cached tenant list whenever a tenant is written or removed."""
+    bump_tenant_list_version()
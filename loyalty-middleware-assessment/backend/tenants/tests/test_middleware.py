@@ -14,23 +14,31 @@ class TenantMiddlewareTests(TestCase):
     - Malformed config
     """
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Create the mock tenant ("coffeechain") once for the whole test case.
+
+        Each test runs inside a transaction that is rolled back afterwards, and
+        Django hands every test its own copy of `cls.tenant`, so per-test changes
+        (e.g. a malformed config) do not leak between tests.
+        """
+        cls.tenant = Tenant.objects.create(
+            name="CoffeeChain",
+            slug="coffeechain",
+            config={"api_key": "secret-key"},
+        )
+
     def setUp(self) -> None:
         """
-        Set up the test environment.
+        Set up the per-test environment.
 
         - Initializes a request factory.
-        - Creates a mock tenant ("coffeechain").
         - Prepares a no-op middleware response lambda that returns a simple JsonResponse.
         """
         self.factory = RequestFactory()
         self.middleware = TenantMiddleware(get_response=lambda r: JsonResponse({"ok": True}))
 
-        self.tenant = Tenant.objects.create(
-            name="CoffeeChain",
-            slug="coffeechain",
-            config={"api_key": "secret-key"},
-        )
-
     def test_valid_tenant_sets_request_tenant(self) -> None:
         """
         Test that a valid tenant slug in `X-Tenant-ID` header correctly attaches
@@ -46,6 +54,24 @@ class TenantMiddlewareTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(getattr(request, "tenant").slug, "coffeechain")
 
+    async def test_async_stack_sets_request_tenant(self) -> None:
+        """
+        Test that the middleware resolves the tenant when wrapped around an async view stack.
+
+        Asserts:
+            - 200 OK response
+            - `request.tenant.slug` matches expected slug
+        """
+        async def get_response(request: HttpRequest) -> HttpResponse:
+            return JsonResponse({"ok": True})
+
+        middleware = TenantMiddleware(get_response=get_response)
+        request: HttpRequest = self.factory.get("/any", HTTP_X_TENANT_ID="coffeechain")
+        response: HttpResponse = await middleware(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(getattr(request, "tenant").slug, "coffeechain")
+
     def test_missing_tenant_header_returns_400(self) -> None:
         """
         Test that a missing `X-Tenant-ID` header results in a 400 Bad Request.
@@ -84,3 +110,50 @@ class TenantMiddlewareTests(TestCase):
 
         self.assertEqual(response.status_code, 500)
         self.assertIn("invalid-tenant-config", response.content.decode())
+
+    def test_coffeechain_auth_headers_helper(self) -> None:
+        """
+        Test that the injected `request.get_tenant_auth_headers` helper builds
+        CoffeeChain's API-key headers from the tenant config.
+
+        Asserts:
+            - API key is always sent
+            - Member ID header is only added when a member ID is given
+        """
+        request: HttpRequest = self.factory.get("/any", HTTP_X_TENANT_ID="coffeechain")
+        self.middleware(request)
+
+        self.assertEqual(request.get_tenant_auth_headers(), {"X-CC-API-Key": "secret-key"})
+        self.assertEqual(
+            request.get_tenant_auth_headers("m-1"),
+            {"X-CC-API-Key": "secret-key", "X-CC-Member-ID": "m-1"},
+        )
+
+    def test_bearer_tenant_auth_headers_helper(self) -> None:
+        """
+        Test that TelcoCorp and FintechApp get bearer-token headers with their own ID header.
+
+        Asserts:
+            - `Authorization` carries the token
+            - The tenant-specific ID header carries the member ID
+            - No headers are built without a member ID or token
+        """
+        for slug, id_header in (("telcocorp", "X-TC-Customer-ID"), ("fintechapp", "X-FA-User-ID")):
+            with self.subTest(slug=slug):
+                Tenant.objects.create(name=slug, slug=slug, config={})
+                request: HttpRequest = self.factory.get("/any", HTTP_X_TENANT_ID=slug)
+                self.middleware(request)
+
+                self.assertEqual(
+                    request.get_tenant_auth_headers("m-1", "tok"),
+                    {"Authorization": "Bearer tok", id_header: "m-1"},
+                )
+                self.assertEqual(request.get_tenant_auth_headers(), {})
+
+    def test_unknown_slug_auth_headers_are_empty(self) -> None:
+        """
+        Test that a tenant slug without a registered header builder yields no outbound headers.
+        """
+        tenant = Tenant(name="Other", slug="other", config={"api_key": "secret-key"})
+
+        self.assertEqual(tenant.auth_header_builder("m-1", "tok"), {})
@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase, APIClient
+
+from tenants.models import Tenant
+
+
+class TenantListHandlerTests(APITestCase):
+    """
+    Test suite for the internal tenant listing endpoint.
+
+    Covers:
+    - Listing tenants with the internal access header
+    - Rejecting tenant-scoped callers without the internal access header
+    - Cache invalidation when tenants change
+    - Conditional GETs via ETag / If-None-Match
+    """
+
+    url = "/api/v1/tenants/"
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        cache.clear()
+
+        self.tenant = Tenant.objects.create(
+            name="CoffeeChain",
+            slug="coffeechain",
+            auth_method="api_key",
+            base_url="https://api.coffeechain.com",
+            config={"currency": "Stars"},
+        )
+
+    def test_lists_tenants(self) -> None:
+        """Should return every tenant with its config."""
+        response = self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["slug"], "coffeechain")
+        self.assertEqual(data[0]["config"], {"currency": "Stars"})
+
+    def test_cached_list_is_invalidated_on_tenant_change(self) -> None:
+        """Creating or updating a tenant should be reflected on the next request."""
+        self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true")
+
+        Tenant.objects.create(
+            name="TelcoCorp",
+            slug="telcocorp",
+            auth_method="oauth2",
+            base_url="https://api.telcocorp.com",
+            config={},
+        )
+        self.tenant.name = "CoffeeChain Renamed"
+        self.tenant.save()
+
+        response = self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true")
+        data = {row["slug"]: row for row in response.json()["data"]}
+
+        self.assertEqual(set(data), {"coffeechain", "telcocorp"})
+        self.assertEqual(data["coffeechain"]["name"], "CoffeeChain Renamed")
+
+    def test_matching_etag_returns_304(self) -> None:
+        """A repeat request with the returned ETag should get 304 until a tenant changes."""
+        first = self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true")
+        etag = first["ETag"]
+
+        not_modified = self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        self.tenant.name = "CoffeeChain Renamed"
+        self.tenant.save()
+
+        modified = self.client.get(self.url, HTTP_X_INTERNAL_ACCESS="true", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified["ETag"], etag)
+
+    def test_missing_internal_header_returns_400(self) -> None:
+        """A tenant-authenticated request without `X-Internal-Access` should get an RFC 7807 error."""
+        self.tenant.config = {"api_key": "test-key", "auth_header": "X-CC-API-Key"}
+        self.tenant.save()
+
+        response = self.client.get(
+            self.url,
+            HTTP_X_TENANT_ID="coffeechain",
+            HTTP_X_CC_API_KEY="test-key",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"]["detail"], "Missing or invalid internal access header.")
+
+    def test_unsupported_method_returns_rfc7807_405(self) -> None:
+        """Non-GET methods should get an RFC 7807 405 with an `Allow` header, like DRF views."""
+        response = self.client.post(self.url, HTTP_X_INTERNAL_ACCESS="true")
+
+        self.assertEqual(response.status_code, 405)
+        self.assertIn("GET", response["Allow"])
+        self.assertEqual(response.json()["error"]["detail"], 'Method "POST" not allowed.')
@@ -0,0 +1,72 @@
+"""
+Outbound authentication header builders for tenant loyalty APIs.
+
+Tenant configuration is static once loaded, so instead of branching on the
+tenant slug for every outbound call, a builder closure is created once per
+tenant with its config values already bound. Calling the builder with
+`(member_id, token)` returns the finished header dictionary.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+AuthHeaderBuilder = Callable[[Optional[str], Optional[str]], Dict[str, str]]
+
+
+def _no_auth_headers(member_id: Optional[str] = None, token: Optional[str] = None) -> Dict[str, str]:
+    """Builder used for unknown tenants or malformed configs."""
+    return {}
+
+
+def _api_key_builder(config: Dict[str, Any]) -> AuthHeaderBuilder:
+    """Builds CoffeeChain-style headers: static API key plus optional member ID."""
+    api_key = config.get("api_key", "")
+
+    def build(member_id: Optional[str] = None, token: Optional[str] = None) -> Dict[str, str]:
+        headers = {"X-CC-API-Key": api_key}
+        if member_id:
+            headers["X-CC-Member-ID"] = member_id
+        return headers
+
+    return build
+
+
+def _bearer_builder(id_header: str) -> Callable[[Dict[str, Any]], AuthHeaderBuilder]:
+    """Returns a factory for bearer-token tenants identified by `id_header`."""
+
+    def factory(config: Dict[str, Any]) -> AuthHeaderBuilder:
+        def build(member_id: Optional[str] = None, token: Optional[str] = None) -> Dict[str, str]:
+            headers = {}
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+            if member_id:
+                headers[id_header] = member_id
+            return headers
+
+        return build
+
+    return factory
+
+
+# Tenant slug -> factory producing that tenant's header builder
+BUILDER_FACTORIES: Dict[str, Callable[[Dict[str, Any]], AuthHeaderBuilder]] = {
+    "coffeechain": _api_key_builder,
+    "telcocorp": _bearer_builder("X-TC-Customer-ID"),
+    "fintechapp": _bearer_builder("X-FA-User-ID"),
+}
+
+
+def make_auth_header_builder(slug: str, config: Any) -> AuthHeaderBuilder:
+    """
+    Create the outbound header builder for a tenant.
+
+    Args:
+        slug (str): Tenant slug (e.g., 'coffeechain').
+        config (Any): Tenant config; anything other than a dict yields no headers.
+
+    Returns:
+        AuthHeaderBuilder: Callable taking `(member_id, token)` and returning headers.
+    """
+    factory = BUILDER_FACTORIES.get(slug)
+    if factory is None or not isinstance(config, dict):
+        return _no_auth_headers
+    return factory(config)
@@ -0,0 +1,48 @@
+"""
+Cache helpers for the tenant list endpoint.
+
+The rendered tenant list is cached under a key that embeds a version number.
+Saving or deleting a tenant bumps the version (see `tenants.signals`), so
+stale bodies are never read again and simply expire from the cache.
+
+Note: with the default per-process `LocMemCache`, a version bump is only seen
+by the process that performed the write; other processes pick up changes once
+their cached body expires (the cache's default TIMEOUT).
+"""
+
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+TENANT_LIST_VERSION_KEY = "tenants:ver"
+
+
+def _initial_version() -> int:
+    # Time-based seed so a version key evicted from the cache never restarts at
+    # a number whose body may still be cached.
+    return time.time_ns()
+
+
+def get_tenant_list_version() -> int:
+    """Returns the current tenant list version, initialising it if missing."""
+    version = cache.get(TENANT_LIST_VERSION_KEY)
+    if version is None:
+        cache.add(TENANT_LIST_VERSION_KEY, _initial_version(), timeout=None)
+        version = cache.get(TENANT_LIST_VERSION_KEY, 0)
+    return version
+
+
+def bump_tenant_list_version() -> None:
+    """Invalidates any cached tenant list by moving to a new version."""
+    try:
+        cache.incr(TENANT_LIST_VERSION_KEY)
+    except ValueError:
+        cache.add(TENANT_LIST_VERSION_KEY, _initial_version(), timeout=None)
+
+
+def tenant_list_cache_key(version: Optional[int] = None) -> str:
+    """Returns the cache key holding the rendered tenant list for `version`."""
+    if version is None:
+        version = get_tenant_list_version()
+    return f"tenants:list:{version}"
@@ -0,0 +1,52 @@
+"""
+Typed view over a tenant's JSON `config`.
+
+`Tenant.config` is a free-form dictionary. Business-rule getters on the model
+read a handful of well-known keys from it on every request; parsing those keys
+once into a slotted dataclass turns each lookup into a plain attribute read.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class TenantConfig:
+    """
+    Well-known keys of a tenant's config. Missing keys fall back to the defaults below.
+
+    Attributes:
+        currency (Optional[str]): Loyalty currency name (e.g., 'Stars').
+        currency_to_usd (Any): Exchange rate from loyalty currency to USD.
+        approval_threshold (Optional[Any]): Amount above which bookings need approval.
+        allowed_cabin_class (Optional[str]): Only cabin class the tenant may book.
+        id_header (Optional[str]): Header carrying the member/customer/user ID.
+        auth_header (Optional[str]): Header carrying the tenant API key.
+        api_key (Optional[str]): Expected inbound API key.
+    """
+
+    currency: Optional[str] = None
+    currency_to_usd: Any = 1.0
+    approval_threshold: Optional[Any] = None
+    allowed_cabin_class: Optional[str] = None
+    id_header: Optional[str] = None
+    auth_header: Optional[str] = None
+    api_key: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, config: Any) -> "TenantConfig":
+        """
+        Builds a `TenantConfig` from a raw config value.
+
+        Args:
+            config (Any): The tenant's `config` field. Non-dict values yield the defaults.
+
+        Returns:
+            TenantConfig: Parsed config.
+        """
+        if not isinstance(config, dict):
+            return cls()
+        return cls(**{name: config[name] for name in _FIELD_NAMES if name in config})
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(TenantConfig))
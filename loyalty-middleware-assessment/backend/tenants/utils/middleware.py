@@ -1,10 +1,33 @@
-from typing import Optional, Dict
-from django.utils.deprecation import MiddlewareMixin
-from django.http import JsonResponse, HttpRequest, HttpResponse
+from typing import Callable, Optional
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
 from tenants.models import Tenant
-
-
-class TenantMiddleware(MiddlewareMixin):
+from utils.error_types import INVALID_TENANT, INVALID_TENANT_CONFIG, MISSING_TENANT_HEADER, UNAUTHORIZED
+from utils.responses import ProblemTemplate
+
+# Pre-serialized rejection bodies; only `detail`/`instance` are encoded per response
+MISSING_TENANT_PROBLEM = ProblemTemplate(
+    type_=MISSING_TENANT_HEADER,
+    title="Missing Tenant ID",
+    status=400,
+    detail="Missing required X-Tenant-ID header.",
+)
+INVALID_TENANT_PROBLEM = ProblemTemplate(type_=INVALID_TENANT, title="Invalid Tenant", status=404)
+INVALID_TENANT_CONFIG_PROBLEM = ProblemTemplate(
+    type_=INVALID_TENANT_CONFIG,
+    title="Invalid Tenant Configuration",
+    status=500,
+)
+UNAUTHORIZED_PROBLEM = ProblemTemplate(type_=UNAUTHORIZED, title="Unauthorized", status=401)
+MISSING_BEARER_PROBLEM = ProblemTemplate(
+    type_=UNAUTHORIZED,
+    title="Unauthorized",
+    status=401,
+    detail="Missing or malformed Bearer token.",
+)
+
+
+class TenantMiddleware:
     """
     Middleware that identifies and authenticates tenants based on the `X-Tenant-ID` header.
 
@@ -14,170 +37,179 @@ class TenantMiddleware(MiddlewareMixin):
     - Injects a helper (`request.get_tenant_auth_headers`) for outbound API calls.
 
     Skips processing for explicitly exempted paths (e.g., health check).
+
+    Supports both sync (WSGI) and async (ASGI) stacks. Under ASGI the tenant
+    lookup is awaited instead of running the whole middleware in a worker thread.
     """
 
-    EXEMPT_PATHS = {"/api/v1/health"}
+    sync_capable = True
+    async_capable = True
+
+    # Paths that skip tenant resolution: the health check (exact match) and the prefixes
+    # below, checked with a single `str.startswith(tuple)` call. The tenant list prefix is
+    # only exempt for internal callers; `/swagger` also covers `/swagger.json|yaml`.
+    EXEMPT_PATH = "/api/v1/health"
+    INTERNAL_PREFIX = "/api/v1/tenants"
+    EXEMPT_PREFIXES = ("/api/v1/admin/bookings/", "/swagger", "/redoc", INTERNAL_PREFIX)
+
+    # Columns loaded for request.tenant; display name and timestamps are deferred
+    TENANT_FIELDS = ("id", "slug", "auth_method", "base_url", "rate_limit_per_minute", "config")
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_request(request) or self.get_response(request)
 
-    def process_request(self, request: HttpRequest) -> Optional[JsonResponse]:
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return await self.aprocess_request(request) or await self.get_response(request)
+
+    def process_request(self, request: HttpRequest) -> Optional[HttpResponse]:
         """
-        Middleware entrypoint for each incoming request.
+        Resolves and authenticates the tenant for each incoming request (sync path).
 
         Args:
             request (HttpRequest): Incoming request object.
 
         Returns:
-            Optional[JsonResponse]: JSON error response if tenant validation or authentication fails,
+            Optional[HttpResponse]: JSON error response if tenant validation or authentication fails,
             otherwise None to proceed with the request lifecycle.
         """
-        if (
-                request.path in self.EXEMPT_PATHS or
-                request.path.startswith("/api/v1/admin/bookings/") or
-                request.path.startswith("/swagger") or
-                request.path.startswith("/redoc") or
-                request.path.startswith("/swagger.json") or
-                request.path.startswith("/swagger.yaml") or
-                (request.path.startswith("/api/v1/tenants") and request.headers.get("X-Internal-Access") == "true")
-        ):
+        if self.is_exempt(request):
             return None
 
         tenant_id = request.headers.get("X-Tenant-ID")
         if not tenant_id:
-            return self.json_error(
-                type_="https://api.loyalty-middleware.com/errors/missing-tenant-header",
-                title="Missing Tenant ID",
-                status=400,
-                detail="Missing required X-Tenant-ID header.",
-                instance=request.path,
-            )
+            return self.missing_tenant_error(request.path)
 
         try:
-            tenant = Tenant.objects.get(slug=tenant_id)
+            tenant = Tenant.objects.only(*self.TENANT_FIELDS).get(slug=tenant_id)
         except Tenant.DoesNotExist:
-            return self.json_error(
-                type_="https://api.loyalty-middleware.com/errors/invalid-tenant",
-                title="Invalid Tenant",
-                status=404,
-                detail=f"No tenant found for identifier '{tenant_id}'.",
-                instance=request.path,
-            )
+            return self.unknown_tenant_error(request.path, tenant_id)
+
+        return self.authenticate(request, tenant)
+
+    async def aprocess_request(self, request: HttpRequest) -> Optional[HttpResponse]:
+        """
+        Async counterpart of `process_request`; awaits the tenant lookup.
+
+        Args:
+            request (HttpRequest): Incoming request object.
+
+        Returns:
+            Optional[HttpResponse]: JSON error response if tenant validation or authentication fails,
+            otherwise None to proceed with the request lifecycle.
+        """
+        if self.is_exempt(request):
+            return None
+
+        tenant_id = request.headers.get("X-Tenant-ID")
+        if not tenant_id:
+            return self.missing_tenant_error(request.path)
+
+        try:
+            tenant = await Tenant.objects.only(*self.TENANT_FIELDS).aget(slug=tenant_id)
+        except Tenant.DoesNotExist:
+            return self.unknown_tenant_error(request.path, tenant_id)
 
+        return self.authenticate(request, tenant)
+
+    def is_exempt(self, request: HttpRequest) -> bool:
+        """
+        Checks whether the request path bypasses tenant resolution.
+
+        The tenant list is only exempt for internal callers (`X-Internal-Access: true`).
+
+        Args:
+            request (HttpRequest): Incoming request object.
+
+        Returns:
+            bool: True if the request should skip tenant handling.
+        """
+        path = request.path
+        if path.startswith(self.EXEMPT_PREFIXES):
+            return not path.startswith(self.INTERNAL_PREFIX) or request.headers.get("X-Internal-Access") == "true"
+        return path == self.EXEMPT_PATH
+
+    def authenticate(self, request: HttpRequest, tenant: Tenant) -> Optional[HttpResponse]:
+        """
+        Validates the resolved tenant, attaches it to the request and runs inbound auth.
+
+        Args:
+            request (HttpRequest): Incoming request object.
+            tenant (Tenant): The tenant matching the `X-Tenant-ID` header.
+
+        Returns:
+            Optional[HttpResponse]: JSON error response on malformed config or failed auth, otherwise None.
+        """
         if not isinstance(tenant.config, dict):
-            return self.json_error(
-                type_="https://api.loyalty-middleware.com/errors/invalid-tenant-config",
-                title="Invalid Tenant Configuration",
-                status=500,
+            return INVALID_TENANT_CONFIG_PROBLEM.render(
+                request.path,
                 detail=f"Tenant '{tenant.slug}' has malformed config. Expected a dictionary.",
-                instance=request.path,
             )
 
         # Attach the tenant object and outbound header helper to the request
         request.tenant = tenant
-        request.get_tenant_auth_headers = lambda member_id=None, token=None: self.get_auth_headers(
-            tenant, member_id, token
-        )
+        request.get_tenant_auth_headers = tenant.auth_header_builder
 
         # Perform inbound authentication based on the tenant's auth method
-        auth_method = tenant.auth_method
-
-        if auth_method == "api_key":
-            auth_header = tenant.get_auth_header()
-            expected_token = tenant.config.get("api_key")
-            incoming_token = request.headers.get(auth_header)
-
-            if not incoming_token or incoming_token != expected_token:
-                return self.json_error(
-                    type_="https://api.loyalty-middleware.com/errors/unauthorized",
-                    title="Unauthorized",
-                    status=401,
-                    detail=f"Missing or invalid auth header: {auth_header}",
-                    instance=request.path,
-                )
-
-        elif auth_method in ["jwt", "oauth2"]:
-            incoming_auth = request.headers.get("Authorization", "")
-            if not incoming_auth.startswith("Bearer "):
-                return self.json_error(
-                    type_="https://api.loyalty-middleware.com/errors/unauthorized",
-                    title="Unauthorized",
-                    status=401,
-                    detail="Missing or malformed Bearer token.",
-                    instance=request.path,
-                )
+        auth_check = self.AUTH_HANDLERS.get(tenant.auth_method)
+        if auth_check is not None:
+            return auth_check(self, request, tenant)
 
         return None
 
-    def json_error(
-        self,
-        *,
-        type_: str,
-        title: str,
-        status: int,
-        detail: str,
-        instance: str,
-    ) -> JsonResponse:
+    def missing_tenant_error(self, instance: str) -> HttpResponse:
+        """Returns the 400 response for requests without an `X-Tenant-ID` header."""
+        return MISSING_TENANT_PROBLEM.render(instance)
+
+    def unknown_tenant_error(self, instance: str, tenant_id: str) -> HttpResponse:
+        """Returns the 404 response for an `X-Tenant-ID` that matches no tenant."""
+        return INVALID_TENANT_PROBLEM.render(instance, detail=f"No tenant found for identifier '{tenant_id}'.")
+
+    def check_api_key(self, request: HttpRequest, tenant: Tenant) -> Optional[HttpResponse]:
         """
-        Constructs a structured JSON error response in RFC 7807 format.
+        Validates the tenant-specific API key header on the incoming request.
 
         Args:
-            type_ (str): A URI reference that identifies the problem type.
-            title (str): A short, human-readable summary of the problem.
-            status (int): HTTP status code.
-            detail (str): Explanation of the specific error.
-            instance (str): The request path where the error occurred.
+            request (HttpRequest): Incoming request object.
+            tenant (Tenant): The resolved tenant.
 
         Returns:
-            JsonResponse: Structured RFC 7807-compliant error payload.
+            Optional[HttpResponse]: 401 error response if the key is missing or wrong, otherwise None.
         """
-        return JsonResponse(
-            {
-                "error": {
-                    "type": type_,
-                    "title": title,
-                    "status": status,
-                    "detail": detail,
-                    "instance": instance,
-                }
-            },
-            status=status,
-        )
-
-    def get_auth_headers(
-        self,
-        tenant: Tenant,
-        member_id: Optional[str] = None,
-        token: Optional[str] = None,
-    ) -> Dict[str, str]:
+        auth_header = tenant.get_auth_header()
+        expected_token = tenant.parsed_config.api_key
+        incoming_token = request.headers.get(auth_header)
+
+        if not incoming_token or incoming_token != expected_token:
+            return UNAUTHORIZED_PROBLEM.render(request.path, detail=f"Missing or invalid auth header: {auth_header}")
+        return None
+
+    def check_bearer_token(self, request: HttpRequest, tenant: Tenant) -> Optional[HttpResponse]:
         """
-        Constructs outbound headers based on tenant-specific auth rules.
+        Validates that the incoming request carries a Bearer token (JWT / OAuth2 tenants).
 
         Args:
-            tenant (Tenant): The tenant object.
-            member_id (Optional[str]): The loyalty member or customer ID.
-            token (Optional[str]): JWT or OAuth2 token, if applicable.
+            request (HttpRequest): Incoming request object.
+            tenant (Tenant): The resolved tenant.
 
         Returns:
-            Dict[str, str]: Dictionary of headers to attach to outbound API calls.
+            Optional[HttpResponse]: 401 error response if the token is missing or malformed, otherwise None.
         """
-        headers: Dict[str, str] = {}
+        incoming_auth = request.headers.get("Authorization", "")
+        if not incoming_auth.startswith("Bearer "):
+            return MISSING_BEARER_PROBLEM.render(request.path)
+        return None
 
-        if not isinstance(tenant.config, dict):
-            return headers
-
-        if tenant.slug == "coffeechain":
-            headers["X-CC-API-Key"] = tenant.config.get("api_key", "")
-            if member_id:
-                headers["X-CC-Member-ID"] = member_id
-
-        elif tenant.slug == "telcocorp":
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-            if member_id:
-                headers["X-TC-Customer-ID"] = member_id
-
-        elif tenant.slug == "fintechapp":
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-            if member_id:
-                headers["X-FA-User-ID"] = member_id
-
-        return headers
+    # Inbound auth check per tenant auth method; methods not listed here are not checked
+    AUTH_HANDLERS = {
+        "api_key": check_api_key,
+        "jwt": check_bearer_token,
+        "oauth2": check_bearer_token,
+    }
@@ -53,7 +53,7 @@ APPROVAL_REQUIRED = f"{BASE_URI}/approval-required"
 
 
 # ===========================================================
-# Mapping from DRF status codes to error types
+# Mapping from DRF status codes to error types and titles
 # ===========================================================
 
 STATUS_CODE_TO_TYPE = {
@@ -64,3 +64,12 @@ STATUS_CODE_TO_TYPE = {
     429: RATE_LIMIT,
     500: INTERNAL_ERROR,
 }
+
+STATUS_CODE_TO_TITLE = {
+    400: "Validation Error",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    429: "Rate Limit Exceeded",
+    500: "Internal Server Error",
+}
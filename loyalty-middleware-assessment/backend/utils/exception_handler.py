@@ -12,9 +12,14 @@ References:
 from rest_framework.views import exception_handler as drf_default_exception_handler
 from rest_framework.response import Response
 
-from utils.rfc7807 import build_problem_response
-from utils.error_types import STATUS_CODE_TO_TYPE, INTERNAL_ERROR
+from utils.error_types import INTERNAL_ERROR, STATUS_CODE_TO_TITLE, STATUS_CODE_TO_TYPE
 from utils.exceptions import ProblemDetailException
+from utils.trace import generate_trace_id
+
+
+# Status code -> (error type URI, fallback title) for DRF-handled exceptions
+_STATUS_META = {code: (type_, STATUS_CODE_TO_TITLE[code]) for code, type_ in STATUS_CODE_TO_TYPE.items()}
+_DEFAULT_META = (INTERNAL_ERROR, "Unhandled error")
 
 
 def rfc7807_exception_handler(exc, context):
@@ -49,9 +54,12 @@ def rfc7807_exception_handler(exc, context):
         # Unexpected exceptions (e.g., ZeroDivisionError) will fall back to Django's 500
         return None
 
-    # Extract request path for the `instance` field (defaults to "/" if missing)
-    request = context.get("request")
-    path = request.path if request else "/"
+    # Extract request path for the `instance` field (defaults to "/" if missing);
+    # DRF always passes the request, so index it directly
+    try:
+        path = context["request"].path
+    except (KeyError, AttributeError):
+        path = "/"
 
     # Get the "detail" string used by DRF in most error responses
     detail = response.data.get("detail", "An error occurred.")
@@ -59,19 +67,23 @@ def rfc7807_exception_handler(exc, context):
     # Preserve any detailed errors for inclusion under "errors" key
     errors = response.data if isinstance(response.data, dict) else {}
 
-    # Use DRF’s built-in default message or fallback
-    title = getattr(exc, "default_detail", "Unhandled error")
-
-    # Resolve the error type URI from status code
-    error_type = STATUS_CODE_TO_TYPE.get(response.status_code, INTERNAL_ERROR)
-
-    # Return an RFC 7807-compliant response using our core utility
-    return build_problem_response(
-        type_=error_type,
-        title=title,
-        status=response.status_code,
-        detail=str(detail),
-        instance=path,
-        extra={"errors": errors},
-        use_drf=True,
-    )
+    # Resolve the error type URI from status code, then use DRF’s built-in
+    # default message or the status's fallback title
+    error_type, default_title = _STATUS_META.get(response.status_code, _DEFAULT_META)
+    title = getattr(exc, "default_detail", default_title)
+
+    # Return an RFC 7807-compliant response; same shape as build_problem_response,
+    # built inline since this path always wants a DRF Response
+    status = response.status_code
+    problem = {
+        "error": {
+            "type": error_type,
+            "title": title,
+            "status": status,
+            "detail": str(detail),
+            "instance": path,
+            "trace_id": generate_trace_id(),
+            "errors": errors,
+        }
+    }
+    return Response(problem, status=status)
@@ -31,3 +31,22 @@ class ProblemDetailException(APIException):
 
         self.status_code = status
         self.detail = payload
+
+    @classmethod
+    def from_error(cls, error: dict) -> "ProblemDetailException":
+        """
+        Wraps an already-built RFC 7807 `error` dict without re-validating it.
+
+        Skips `__init__` and its keyword binding; used by the hot raise-helpers in
+        `utils.rfc7807`, which build the dict as one literal from closure-bound members.
+
+        Args:
+            error (dict): Problem members, including at least `status`.
+
+        Returns:
+            ProblemDetailException: Exception ready to be raised.
+        """
+        exc = cls.__new__(cls)
+        exc.status_code = error["status"]
+        exc.detail = {"error": error}
+        return exc
@@ -0,0 +1,70 @@
+"""
+Lightweight JSON response helpers.
+
+Django's `JsonResponse` encodes through the stdlib `json` module. The helpers
+here use `orjson` instead, which is considerably faster for the small payloads
+returned on hot paths such as middleware rejections.
+"""
+
+from typing import Optional
+
+import orjson
+from django.http import HttpResponse
+
+
+# Placeholders spliced out of pre-serialized bodies; NUL bytes never occur in real values
+_DETAIL_MARK = "\x00detail\x00"
+_INSTANCE_MARK = "\x00instance\x00"
+
+
+class ProblemTemplate:
+    """
+    An RFC 7807 error body serialized once, with `detail` and `instance` filled in per response.
+
+    The static members (`type`, `title`, `status` and, optionally, a fixed
+    `detail`) are encoded at construction time. Rendering only JSON-encodes
+    the variable strings and concatenates them between the prebuilt chunks.
+
+    Args:
+        type_ (str): A URI reference that identifies the problem type.
+        title (str): A short, human-readable summary of the problem.
+        status (int): HTTP status code.
+        detail (str, optional): Fixed explanation; if omitted it is supplied to `render()`.
+    """
+
+    def __init__(self, *, type_: str, title: str, status: int, detail: Optional[str] = None) -> None:
+        self.status = status
+        self.static_detail = detail is not None
+        body = orjson.dumps(
+            {
+                "error": {
+                    "type": type_,
+                    "title": title,
+                    "status": status,
+                    "detail": detail if self.static_detail else _DETAIL_MARK,
+                    "instance": _INSTANCE_MARK,
+                }
+            }
+        )
+        head, self._tail = body.split(orjson.dumps(_INSTANCE_MARK))
+        if self.static_detail:
+            self._head, self._middle = head, b""
+        else:
+            self._head, self._middle = head.split(orjson.dumps(_DETAIL_MARK))
+
+    def render(self, instance: str, detail: Optional[str] = None) -> HttpResponse:
+        """
+        Builds the error response for one occurrence of the problem.
+
+        Args:
+            instance (str): The request path where the error occurred.
+            detail (str, optional): Explanation of the error; ignored if the template has a fixed detail.
+
+        Returns:
+            HttpResponse: JSON response with the template's status code.
+        """
+        if self.static_detail:
+            content = self._head + orjson.dumps(instance) + self._tail
+        else:
+            content = self._head + orjson.dumps(detail) + self._middle + orjson.dumps(instance) + self._tail
+        return HttpResponse(content, status=self.status, content_type="application/json")
@@ -18,6 +18,7 @@ from utils.error_types import (
     NOT_FOUND,
     INTERNAL_ERROR,
     RATE_LIMIT,
+    MISSING_TENANT_HEADER,
 )
 from utils.exceptions import ProblemDetailException
 from utils.trace import generate_trace_id
@@ -71,100 +72,87 @@ def build_problem_response(
 #             Convenience Wrappers: Raise Variants (used in logic flow)
 # ------------------------------------------------------------------------------
 
-def validation_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 400 Validation Error."""
-    raise ProblemDetailException(
-        type_=VALIDATION_ERROR,
-        title="Validation Error",
-        status=400,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
-
-
-def unauthorized_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 401 Unauthorized Error."""
-    raise ProblemDetailException(
-        type_=UNAUTHORIZED,
-        title="Unauthorized",
-        status=401,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
-
-
-def forbidden_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 403 Forbidden Error."""
-    raise ProblemDetailException(
-        type_=FORBIDDEN,
-        title="Forbidden",
-        status=403,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
-
-
-def not_found_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 404 Not Found Error."""
-    raise ProblemDetailException(
-        type_=NOT_FOUND,
-        title="Not Found",
-        status=404,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
+def _problem_raiser(name: str, type_: str, title: str, status: int, doc: str):
+    """
+    Creates a raise-helper with its problem's static members bound in the closure.
 
+    Each generated helper builds the `error` dict as a single literal and raises
+    it via `ProblemDetailException.from_error`, with no template copy or extra frame.
 
-def internal_server_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 500 Internal Server Error."""
-    raise ProblemDetailException(
-        type_=INTERNAL_ERROR,
-        title="Internal Server Error",
-        status=500,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
+    Args:
+        name (str): Public function name (used for `__name__` / tracebacks).
+        type_ (str): Problem type URI.
+        title (str): Problem title.
+        status (int): HTTP status code.
+        doc (str): Docstring for the generated helper.
 
+    Returns:
+        Callable[[str, str, dict], None]: Helper taking `(detail, instance, extra=None)`.
+    """
+    def raise_problem(detail: str, instance: str, extra: dict = None) -> None:
+        error = {
+            "type": type_,
+            "title": title,
+            "status": status,
+            "detail": detail,
+            "instance": instance,
+            "trace_id": generate_trace_id(),
+        }
+        if extra:
+            error.update(extra)
+        raise ProblemDetailException.from_error(error)
 
-def service_unavailable_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 503 Service Unavailable Error."""
-    raise ProblemDetailException(
-        type_="https://api.loyalty-middleware.com/errors/service-unavailable",
-        title="Service Unavailable",
-        status=503,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
+    raise_problem.__name__ = raise_problem.__qualname__ = name
+    raise_problem.__doc__ = doc
+    return raise_problem
 
 
-def rate_limit_error(detail: str, instance: str, extra: dict = None) -> None:
-    """Raises a 429 Rate Limit Exceeded Error."""
-    raise ProblemDetailException(
-        type_=RATE_LIMIT,
-        title="Rate Limit Exceeded",
-        status=429,
-        detail=detail,
-        instance=instance,
-        extra=extra,
-    )
+validation_error = _problem_raiser(
+    "validation_error", VALIDATION_ERROR, "Validation Error", 400,
+    "Raises a 400 Validation Error.",
+)
+unauthorized_error = _problem_raiser(
+    "unauthorized_error", UNAUTHORIZED, "Unauthorized", 401,
+    "Raises a 401 Unauthorized Error.",
+)
+forbidden_error = _problem_raiser(
+    "forbidden_error", FORBIDDEN, "Forbidden", 403,
+    "Raises a 403 Forbidden Error.",
+)
+not_found_error = _problem_raiser(
+    "not_found_error", NOT_FOUND, "Not Found", 404,
+    "Raises a 404 Not Found Error.",
+)
+internal_server_error = _problem_raiser(
+    "internal_server_error", INTERNAL_ERROR, "Internal Server Error", 500,
+    "Raises a 500 Internal Server Error.",
+)
+service_unavailable_error = _problem_raiser(
+    "service_unavailable_error",
+    "https://api.loyalty-middleware.com/errors/service-unavailable",
+    "Service Unavailable",
+    503,
+    "Raises a 503 Service Unavailable Error.",
+)
+rate_limit_error = _problem_raiser(
+    "rate_limit_error", RATE_LIMIT, "Rate Limit Exceeded", 429,
+    "Raises a 429 Rate Limit Exceeded Error.",
+)
 
 
 def missing_tenant_header_error(instance: str, extra: dict = None) -> None:
     """Raises a 400 Bad Request error when the X-Tenant-ID header is missing."""
-    raise ProblemDetailException(
-        type_="https://api.loyalty-middleware.com/errors/missing-tenant-header",
-        title="Missing Tenant ID",
-        status=400,
-        detail="Missing required X-Tenant-ID header.",
-        instance=instance,
-        extra=extra,
-    )
+    error = {
+        "type": MISSING_TENANT_HEADER,
+        "title": "Missing Tenant ID",
+        "status": 400,
+        "detail": "Missing required X-Tenant-ID header.",
+        "instance": instance,
+        "trace_id": generate_trace_id(),
+    }
+    if extra:
+        error.update(extra)
+    raise ProblemDetailException.from_error(error)
 
 
 # ------------------------------------------------------------------------------
@@ -25,6 +25,10 @@ class TenantThrottle(SimpleRateThrottle):
 
     scope = "tenant"
 
+    # rate_limit_per_minute -> (rate string, num_requests, duration); only a
+    # handful of distinct limits exist across tenants, so this stays tiny
+    _RATE_CACHE: dict = {}
+
     def get_cache_key(self, request: Request, view) -> Optional[str]:
         """
         Generates a cache key used to throttle requests per tenant and IP address.
@@ -45,11 +49,13 @@ class TenantThrottle(SimpleRateThrottle):
         self.tenant = tenant
         rate_limit = getattr(tenant, "rate_limit_per_minute", 100)
 
-        # Convert limit into DRF string format (e.g., "2/min")
-        self.rate = f"{rate_limit}/min"
-
-        # Parse into number of allowed requests and time window
-        self.num_requests, self.duration = self.parse_rate(self.rate)
+        # Convert limit into DRF string format (e.g., "2/min") and parse it into
+        # number of allowed requests and time window, once per distinct limit
+        parsed = self._RATE_CACHE.get(rate_limit)
+        if parsed is None:
+            rate = f"{rate_limit}/min"
+            parsed = TenantThrottle._RATE_CACHE[rate_limit] = (rate, *self.parse_rate(rate))
+        self.rate, self.num_requests, self.duration = parsed
 
         # Use client IP to help isolate per-user behaviour within the tenant
         ident = self.get_ident(request)
@@ -1,6 +1,6 @@
-import uuid
+import os
 
 
 def generate_trace_id() -> str:
-    """Generate a unique trace ID for RFC 7807 errors."""
-    return str(uuid.uuid4())
+    """Generate a unique trace ID (32 hex chars, 128 random bits) for RFC 7807 errors."""
+    return os.urandom(16).hex()
@@ -1,29 +1,183 @@
 from fastapi import FastAPI, HTTPException, Header, Request
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional
+from datetime import datetime
+from functools import lru_cache
+import asyncio
 import logging
-import uuid
+import time
+from secrets import token_hex
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="CoffeeChain API Mock", version="1.0.0")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = FastAPI(
+    title="CoffeeChain API Mock",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Test API key
 TEST_API_KEY = "test_cc_api_key_12345"
 
-# In-memory storage for members (resets hourly in production)
-members_data = {
+def error_body(error: str, message: str) -> bytes:
+    """Encode an error the way HTTPException(detail={...}) renders it"""
+    return orjson.dumps({"detail": {"error": error, "message": message}})
+
+INVALID_API_KEY_ERROR = (401, error_body("unauthorized", "Invalid API key"))
+
+# X-Mock-Error values that fail every API call; endpoint-specific values
+# (insufficient-balance, approval-required) are handled by their endpoints
+MOCK_ERRORS = {
+    b"true": (500, error_body("internal_error", "Simulated error for testing")),
+    b"auth-failed": (401, error_body("unauthorized", "Authentication failed")),
+}
+
+# Static/repeated HTTPException details; shared read-only dicts (the exception
+# handler only wraps them), while exceptions themselves are raised fresh
+TRANSACTION_NOT_OWNED_DETAIL = {
+    "error": "unauthorized",
+    "message": "Transaction does not belong to this member"
+}
+
+@lru_cache(maxsize=256)
+def member_not_found_detail(member_id: str) -> dict:
+    """404 detail for an unknown member, built once per member ID"""
+    return {
+        "error": "member_not_found",
+        "message": f"Member {member_id} not found"
+    }
+
+async def send_error(send, status: int, body: bytes):
+    """Send a complete JSON error response on a raw ASGI channel"""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+MEMBER_ACTIONS = frozenset(("balance", "deduct", "refund"))
+
+
+def is_api_route(path: str) -> bool:
+    """Match only the routed /api/ endpoints so unknown paths still 404"""
+    if path == "/api/v1/approvals/check":
+        return True
+    parts = path.split("/")
+    # "", "api", "v1", "members", member_id, action
+    return (
+        len(parts) == 6
+        and parts[1:4] == ["api", "v1", "members"]
+        and parts[4] != ""
+        and parts[5] in MEMBER_ACTIONS
+    )
+
+
+class MockAuthMiddleware:
+    """Verify X-CC-API-Key and apply X-Mock-Error for routed /api/ endpoints before routing"""
+
+    def __init__(self, app):
+        self.app = app
+        self.api_key = TEST_API_KEY.encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not is_api_route(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        api_key = mock_error = None
+        for name, value in scope["headers"]:
+            if name == b"x-cc-api-key":
+                api_key = value
+            elif name == b"x-mock-error":
+                mock_error = value
+
+        if api_key != self.api_key:
+            logger.warning(f"Invalid API key: {api_key.decode('latin-1') if api_key is not None else None}")
+            await send_error(send, *INVALID_API_KEY_ERROR)
+            return
+
+        if mock_error is not None:
+            error = MOCK_ERRORS.get(mock_error)
+            if error is not None:
+                await send_error(send, *error)
+                return
+            if mock_error == b"api-timeout":
+                await asyncio.sleep(35)  # Simulate timeout without blocking the loop
+
+        await self.app(scope, receive, send)
+
+# Wildcard CORS never varies per route, so the response headers are fixed
+# bytes; the request Origin is echoed since "*" is rejected with credentials
+CORS_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+
+class WildcardCORSMiddleware:
+    """Allow any origin, method and header without per-request matching"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_headers = None
+        preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                preflight = True
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if preflight and scope["method"] == "OPTIONS":
+            headers = [(b"access-control-allow-origin", origin), *PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"access-control-allow-origin", origin),
+                    *CORS_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+# Registered before CORS so auth/mock errors still carry CORS headers
+app.add_middleware(MockAuthMiddleware)
+app.add_middleware(WildcardCORSMiddleware)
+
+# Initial member state, restored on every hourly reset
+_INITIAL_MEMBERS = {
     "CC1234567": {
         "name": "John Doe",
         "email": "john.doe@email.com",
@@ -54,27 +208,59 @@ members_data = {
     }
 }
 
+# In-memory storage for members (resets hourly in production), one dict per
+# field so the balance hot path reads flat member_id -> value maps
+member_names = {}
+member_emails = {}
+member_balances = {}
+member_statuses = {}
+member_tiers = {}
+
+def load_initial_members():
+    """Populate the per-field member dicts from _INITIAL_MEMBERS"""
+    for field in (member_names, member_emails, member_balances, member_statuses, member_tiers):
+        field.clear()
+    for member_id, member in _INITIAL_MEMBERS.items():
+        member_names[member_id] = member["name"]
+        member_emails[member_id] = member["email"]
+        member_balances[member_id] = member["balance"]
+        member_statuses[member_id] = member["status"]
+        member_tiers[member_id] = member["tier"]
+
+load_initial_members()
+
 # Track deductions for refunds
 deductions_log = {}
 
-# Track last reset time
-last_reset = datetime.utcnow()
+# Track last reset time (monotonic seconds)
+RESET_INTERVAL = 3600.0
+last_reset = time.monotonic()
 
 def reset_data_if_needed():
     """Reset data every hour"""
-    global last_reset, members_data, deductions_log
-    if datetime.utcnow() - last_reset > timedelta(hours=1):
+    global last_reset
+    now = time.monotonic()
+    if now - last_reset > RESET_INTERVAL:
         # Reset to initial state
-        members_data = {
-            "CC1234567": {"name": "John Doe", "email": "john.doe@email.com", "balance": 150000, "status": "active", "tier": "gold"},
-            "CC2222222": {"name": "Jane Smith", "email": "jane.smith@email.com", "balance": 45000, "status": "active", "tier": "silver"},
-            "CC3333333": {"name": "Bob Johnson", "email": "bob.johnson@email.com", "balance": 500000, "status": "active", "tier": "platinum"},
-            "CC0000000": {"name": "Test User", "email": "test@email.com", "balance": 1000, "status": "active", "tier": "bronze"}
-        }
-        deductions_log = {}
-        last_reset = datetime.utcnow()
+        load_initial_members()
+        deductions_log.clear()
+        last_reset = now
         logger.info("Data reset completed")
 
+# Rate limit headers; only the reset epoch changes, and only once per second
+RATE_LIMIT_HEADERS = {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "95"}
+_reset_second = 0
+_reset_header = ""
+
+def rate_limit_reset_header() -> str:
+    """Epoch seconds one minute from now, re-formatted at most once per second"""
+    global _reset_second, _reset_header
+    now = int(time.time())
+    if now != _reset_second:
+        _reset_second = now
+        _reset_header = str(now + 60)
+    return _reset_header
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests"""
@@ -84,104 +270,40 @@ async def log_requests(request: Request, call_next):
     response = await call_next(request)
     
     # Add rate limit headers
-    response.headers["X-RateLimit-Limit"] = "100"
-    response.headers["X-RateLimit-Remaining"] = "95"
-    response.headers["X-RateLimit-Reset"] = str(int((datetime.utcnow() + timedelta(minutes=1)).timestamp()))
+    response.headers.update(RATE_LIMIT_HEADERS)
+    response.headers["X-RateLimit-Reset"] = rate_limit_reset_header()
     
     return response
 
-def verify_api_key(x_cc_api_key: Optional[str] = Header(None)):
-    """Verify API key"""
-    if x_cc_api_key != TEST_API_KEY:
-        logger.warning(f"Invalid API key: {x_cc_api_key}")
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "unauthorized",
-                "message": "Invalid API key"
-            }
-        )
-    return x_cc_api_key
-
-def check_mock_error(x_mock_error: Optional[str] = Header(None)):
-    """Simulate errors for testing"""
-    if x_mock_error == "true":
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "internal_error",
-                "message": "Simulated error for testing"
-            }
-        )
-    elif x_mock_error == "auth-failed":
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "unauthorized",
-                "message": "Authentication failed"
-            }
-        )
-    elif x_mock_error == "api-timeout":
-        import time
-        time.sleep(35)  # Simulate timeout
-
-class BalanceResponse(BaseModel):
-    member_id: str
-    balance: int
-    currency: str = "stars"
-    tier: str
-    status: str
-
 @app.get("/api/v1/members/{member_id}/balance")
 async def get_member_balance(
-    member_id: str,
-    x_cc_api_key: str = Header(None),
-    x_mock_error: Optional[str] = Header(None)
+    member_id: str
 ):
     """Get member's star balance"""
-    verify_api_key(x_cc_api_key)
-    check_mock_error(x_mock_error)
-    
-    if member_id not in members_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "member_not_found",
-                "message": f"Member {member_id} not found"
-            }
-        )
+    balance = member_balances.get(member_id)
+    if balance is None:
+        raise HTTPException(status_code=404, detail=member_not_found_detail(member_id))
     
-    member = members_data[member_id]
-    return BalanceResponse(
-        member_id=member_id,
-        balance=member["balance"],
-        tier=member["tier"],
-        status=member["status"]
-    )
+    return {
+        "member_id": member_id,
+        "balance": balance,
+        "currency": "stars",
+        "tier": member_tiers[member_id],
+        "status": member_statuses[member_id]
+    }
 
 class DeductRequest(BaseModel):
     amount: int
     reference_id: str
     description: str
 
-class DeductResponse(BaseModel):
-    transaction_id: str
-    member_id: str
-    amount_deducted: int
-    remaining_balance: int
-    timestamp: str
-
 @app.post("/api/v1/members/{member_id}/deduct")
 async def deduct_stars(
     member_id: str,
     request: DeductRequest,
-    x_cc_api_key: str = Header(None),
     x_mock_error: Optional[str] = Header(None)
 ):
     """Deduct stars from member balance"""
-    verify_api_key(x_cc_api_key)
-    check_mock_error(x_mock_error)
-    
     if x_mock_error == "insufficient-balance":
         raise HTTPException(
             status_code=400,
@@ -193,71 +315,52 @@ async def deduct_stars(
             }
         )
     
-    if member_id not in members_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "member_not_found",
-                "message": f"Member {member_id} not found"
-            }
-        )
-    
-    member = members_data[member_id]
+    balance = member_balances.get(member_id)
+    if balance is None:
+        raise HTTPException(status_code=404, detail=member_not_found_detail(member_id))
     
-    if member["balance"] < request.amount:
+    if balance < request.amount:
         raise HTTPException(
             status_code=400,
             detail={
                 "error": "insufficient_balance",
                 "message": "Member has insufficient stars",
-                "current_balance": member["balance"],
+                "current_balance": balance,
                 "requested_amount": request.amount
             }
         )
     
     # Deduct stars
-    member["balance"] -= request.amount
-    transaction_id = f"txn_{uuid.uuid4().hex[:12]}"
+    member_balances[member_id] = balance - request.amount
+    transaction_id = f"txn_{token_hex(6)}"
+    timestamp = datetime.utcnow().isoformat()
     
     # Log deduction for potential refund
     deductions_log[transaction_id] = {
         "member_id": member_id,
         "amount": request.amount,
         "reference_id": request.reference_id,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": timestamp
     }
     
-    return DeductResponse(
-        transaction_id=transaction_id,
-        member_id=member_id,
-        amount_deducted=request.amount,
-        remaining_balance=member["balance"],
-        timestamp=datetime.utcnow().isoformat()
-    )
+    return {
+        "transaction_id": transaction_id,
+        "member_id": member_id,
+        "amount_deducted": request.amount,
+        "remaining_balance": member_balances[member_id],
+        "timestamp": timestamp
+    }
 
 class RefundRequest(BaseModel):
     transaction_id: str
     reason: str
 
-class RefundResponse(BaseModel):
-    refund_id: str
-    transaction_id: str
-    member_id: str
-    amount_refunded: int
-    new_balance: int
-    timestamp: str
-
 @app.post("/api/v1/members/{member_id}/refund")
 async def refund_stars(
     member_id: str,
-    request: RefundRequest,
-    x_cc_api_key: str = Header(None),
-    x_mock_error: Optional[str] = Header(None)
+    request: RefundRequest
 ):
     """Refund stars to member"""
-    verify_api_key(x_cc_api_key)
-    check_mock_error(x_mock_error)
-    
     if request.transaction_id not in deductions_log:
         raise HTTPException(
             status_code=404,
@@ -270,82 +373,59 @@ async def refund_stars(
     transaction = deductions_log[request.transaction_id]
     
     if transaction["member_id"] != member_id:
-        raise HTTPException(
-            status_code=403,
-            detail={
-                "error": "unauthorized",
-                "message": "Transaction does not belong to this member"
-            }
-        )
+        raise HTTPException(status_code=403, detail=TRANSACTION_NOT_OWNED_DETAIL)
     
-    if member_id not in members_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "member_not_found",
-                "message": f"Member {member_id} not found"
-            }
-        )
+    if member_id not in member_balances:
+        raise HTTPException(status_code=404, detail=member_not_found_detail(member_id))
     
     # Refund stars
-    member = members_data[member_id]
-    member["balance"] += transaction["amount"]
+    member_balances[member_id] += transaction["amount"]
     
-    refund_id = f"ref_{uuid.uuid4().hex[:12]}"
+    refund_id = f"ref_{token_hex(6)}"
     
-    return RefundResponse(
-        refund_id=refund_id,
-        transaction_id=request.transaction_id,
-        member_id=member_id,
-        amount_refunded=transaction["amount"],
-        new_balance=member["balance"],
-        timestamp=datetime.utcnow().isoformat()
-    )
+    return {
+        "refund_id": refund_id,
+        "transaction_id": request.transaction_id,
+        "member_id": member_id,
+        "amount_refunded": transaction["amount"],
+        "new_balance": member_balances[member_id],
+        "timestamp": datetime.utcnow().isoformat()
+    }
 
 class ApprovalCheckRequest(BaseModel):
     member_id: str
     amount: int
     booking_reference: str
 
-class ApprovalCheckResponse(BaseModel):
-    approval_required: bool
-    approval_id: Optional[str]
-    reason: Optional[str]
-    estimated_time: Optional[str]
-
 @app.post("/api/v1/approvals/check")
 async def check_approval_requirement(
     request: ApprovalCheckRequest,
-    x_cc_api_key: str = Header(None),
     x_mock_error: Optional[str] = Header(None)
 ):
     """Check if booking requires approval (>50k stars)"""
-    verify_api_key(x_cc_api_key)
-    check_mock_error(x_mock_error)
-    
     if x_mock_error == "approval-required":
-        return ApprovalCheckResponse(
-            approval_required=True,
-            approval_id=f"appr_{uuid.uuid4().hex[:12]}",
-            reason="Forced approval for testing",
-            estimated_time="PT24H"
-        )
+        return {
+            "approval_required": True,
+            "approval_id": f"appr_{token_hex(6)}",
+            "reason": "Forced approval for testing",
+            "estimated_time": "PT24H"
+        }
     
     # Check if amount exceeds 50,000 stars
     if request.amount > 50000:
-        return ApprovalCheckResponse(
-            approval_required=True,
-            approval_id=f"appr_{uuid.uuid4().hex[:12]}",
-            reason=f"Booking exceeds 50,000 stars limit ({request.amount} stars)",
-            estimated_time="PT24H"  # 24 hours in ISO 8601 duration
-        )
+        return {
+            "approval_required": True,
+            "approval_id": f"appr_{token_hex(6)}",
+            "reason": f"Booking exceeds 50,000 stars limit ({request.amount} stars)",
+            "estimated_time": "PT24H"  # 24 hours in ISO 8601 duration
+        }
     
-    return ApprovalCheckResponse(
-        approval_required=False,
-        approval_id=None,
-        reason=None,
-        estimated_time=None
-    )
+    return {
+        "approval_required": False,
+        "approval_id": None,
+        "reason": None,
+        "estimated_time": None
+    }
 
 @app.get("/health")
 async def health_check():
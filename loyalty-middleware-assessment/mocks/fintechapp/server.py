@@ -1,18 +1,28 @@
-from fastapi import FastAPI, HTTPException, Header, Request, Depends
+from fastapi import FastAPI, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError as JWTError
+from functools import lru_cache
+import asyncio
+import copy
 import logging
-import uuid
+import time
 import secrets
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="FintechApp API Mock", version="1.0.0")
+app = FastAPI(
+    title="FintechApp API Mock",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,14 +32,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger bodies; the typical small JSON responses pass through as-is
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 security = HTTPBearer()
 
 # JWT configuration
-SECRET_KEY = "fintechapp_secret_key_for_jwt_signing"
+# Kept as bytes so PyJWT uses the HMAC key as-is instead of encoding it per call
+SECRET_KEY = b"fintechapp_secret_key_for_jwt_signing"
 ALGORITHM = "HS256"
+ALGORITHMS = [ALGORITHM]
+SESSION_TTL = 86400  # seconds (24 hours)
 
-# In-memory storage for users and sessions
-users_data = {
+# Initial user state, restored on every hourly reset
+_INITIAL_USERS = {
     "FA_12345678": {
         "name": "Sarah Connor",
         "email": "sarah.c@email.com",
@@ -56,193 +72,222 @@ users_data = {
     }
 }
 
+# In-memory storage for users (resets hourly)
+users_data = copy.deepcopy(_INITIAL_USERS)
+
 # Track coin usage for refunds
 deductions_log = {}
 
 # Active sessions
 active_sessions = {}
 
-# Track last reset time
-last_reset = datetime.utcnow()
-
-def reset_data_if_needed():
-    """Reset data every hour"""
-    global last_reset, users_data, deductions_log, active_sessions
-    if datetime.utcnow() - last_reset > timedelta(hours=1):
-        users_data = {
-            "FA_12345678": {"name": "Sarah Connor", "email": "sarah.c@email.com", "coins": 2500.00, "status": "active", "cashback_rate": 0.02, "total_cashback": 125.50},
-            "FA_87654321": {"name": "Michael Chen", "email": "michael.c@email.com", "coins": 10000.00, "status": "active", "cashback_rate": 0.02, "total_cashback": 450.00},
-            "FA_11111111": {"name": "Test User", "email": "test.user@email.com", "coins": 50.00, "status": "active", "cashback_rate": 0.02, "total_cashback": 0.00}
-        }
-        deductions_log = {}
-        active_sessions = {}
-        last_reset = datetime.utcnow()
-        logger.info("Data reset completed")
-
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests and add rate limit headers"""
-    reset_data_if_needed()
-    
-    logger.info(f"{request.method} {request.url.path}")
-    response = await call_next(request)
-    
-    # Add rate limit headers
-    response.headers["X-RateLimit-Limit"] = "200"
-    response.headers["X-RateLimit-Remaining"] = "195"
-    response.headers["X-RateLimit-Reset"] = str(int((datetime.utcnow() + timedelta(minutes=1)).timestamp()))
-    
-    return response
+RESET_INTERVAL = 3600  # seconds
+
+def reset_data():
+    """Restore the initial in-memory state"""
+    users_data.clear()
+    users_data.update(copy.deepcopy(_INITIAL_USERS))
+    deductions_log.clear()
+    active_sessions.clear()
+    logger.info("Data reset completed")
+
+async def reset_data_periodically():
+    """Reset data every hour, off the request path"""
+    while True:
+        await asyncio.sleep(RESET_INTERVAL)
+        reset_data()
+
+_reset_task = None
+
+@app.on_event("startup")
+async def start_reset_task():
+    global _reset_task
+    _reset_task = asyncio.create_task(reset_data_periodically())
+
+@app.on_event("shutdown")
+async def stop_reset_task():
+    if _reset_task is not None:
+        _reset_task.cancel()
+
+# Static HTTPException details, shared read-only across requests (exceptions
+# themselves are raised fresh: re-raising one instance grows its traceback)
+SIMULATED_ERROR_DETAIL = {"error": "internal_error", "message": "Simulated error for testing"}
+AUTH_FAILED_DETAIL = {"error": "unauthorized", "message": "Authentication failed"}
+INVALID_TOKEN_STRUCTURE_DETAIL = {"error": "invalid_token", "message": "Invalid token structure"}
+SESSION_EXPIRED_DETAIL = {"error": "session_expired", "message": "Session has expired or is invalid"}
+SESSION_MISMATCH_DETAIL = {"error": "session_mismatch", "message": "Session does not match token"}
+INVALID_TOKEN_DETAIL = {"error": "invalid_token", "message": "Could not validate token"}
+FORBIDDEN_OTHER_USER_DETAIL = {"error": "forbidden", "message": "Cannot access other user's data"}
+
+@lru_cache(maxsize=256)
+def user_not_found_detail(user_id: str) -> dict:
+    """404 detail for an unknown user, built once per ID"""
+    return {
+        "error": "user_not_found",
+        "message": f"User {user_id} not found"
+    }
+
+# Static rate limit headers, appended to every response
+RATE_LIMIT_HEADERS = [
+    (b"x-ratelimit-limit", b"200"),
+    (b"x-ratelimit-remaining", b"195"),
+]
+
+_reset_second = 0
+_reset_header = b""
+
+def rate_limit_reset_header() -> bytes:
+    """Epoch seconds one minute from now, re-encoded at most once per second"""
+    global _reset_second, _reset_header
+    now = int(time.time())
+    if now != _reset_second:
+        _reset_second = now
+        _reset_header = str(now + 60).encode("latin-1")
+    return _reset_header
+
+class RateLimitHeadersMiddleware:
+    """Log all requests and add rate limit and response time headers in one pass"""
+
+    def __init__(self, app):
+        self.app = app
 
-def check_mock_error(x_mock_error: Optional[str] = Header(None)):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        # Logged as 500 if the app raises before sending a response
+        status = 500
+
+        async def send_with_headers(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *RATE_LIMIT_HEADERS,
+                    (b"x-ratelimit-reset", rate_limit_reset_header()),
+                    (b"x-response-time", f"{elapsed_ms:.1f}ms".encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"{scope['method']} {scope['path']} {status} {elapsed_ms:.1f}ms")
+
+app.add_middleware(RateLimitHeadersMiddleware)
+
+# X-Mock-Error values that fail the request outright -> (status, detail)
+MOCK_ERRORS = {
+    "true": (500, SIMULATED_ERROR_DETAIL),
+    "auth-failed": (401, AUTH_FAILED_DETAIL),
+}
+
+async def check_mock_error(x_mock_error: Optional[str] = Header(None)):
     """Simulate errors for testing"""
-    if x_mock_error == "true":
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "internal_error",
-                "message": "Simulated error for testing"
-            }
-        )
-    elif x_mock_error == "auth-failed":
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "unauthorized",
-                "message": "Authentication failed"
-            }
-        )
-    elif x_mock_error == "api-timeout":
-        import time
-        time.sleep(35)
+    if x_mock_error is None:
+        return
+    error = MOCK_ERRORS.get(x_mock_error)
+    if error is not None:
+        raise HTTPException(status_code=error[0], detail=error[1])
+    if x_mock_error == "api-timeout":
+        await asyncio.sleep(35)  # Simulate timeout without blocking the loop
 
 def create_jwt_token(user_id: str, session_id: str) -> str:
     """Create a JWT token"""
-    expire = datetime.utcnow() + timedelta(hours=24)
+    now = datetime.utcnow()
     payload = {
         "sub": user_id,
         "session_id": session_id,
-        "exp": expire,
-        "iat": datetime.utcnow()
+        "exp": now + timedelta(seconds=SESSION_TTL),
+        "iat": now
     }
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
+@lru_cache(maxsize=4096)
+def decode_jwt_token(token: str) -> dict:
+    """Verify a JWT's signature and decode it, once per token string.
+
+    Callers must re-check `exp`: a cached payload outlives the decode-time
+    expiry check. Invalid tokens raise and are therefore never cached.
+    """
+    return jwt.decode(token, SECRET_KEY, algorithms=ALGORITHMS)
+
 def verify_jwt_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify JWT token and session"""
     token = credentials.credentials
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_jwt_token(token)
+        exp = payload.get("exp")
+        if exp is not None and time.time() > exp:
+            raise jwt.ExpiredSignatureError("Signature has expired")
         user_id = payload.get("sub")
         session_id = payload.get("session_id")
         
         if not user_id or not session_id:
-            raise HTTPException(
-                status_code=401,
-                detail={
-                    "error": "invalid_token",
-                    "message": "Invalid token structure"
-                }
-            )
+            raise HTTPException(status_code=401, detail=INVALID_TOKEN_STRUCTURE_DETAIL)
         
         # Check if session is active
-        if session_id not in active_sessions:
-            raise HTTPException(
-                status_code=401,
-                detail={
-                    "error": "session_expired",
-                    "message": "Session has expired or is invalid"
-                }
-            )
+        session = active_sessions.get(session_id)
+        if session is None:
+            raise HTTPException(status_code=401, detail=SESSION_EXPIRED_DETAIL)
         
-        session = active_sessions[session_id]
         if session["user_id"] != user_id:
-            raise HTTPException(
-                status_code=401,
-                detail={
-                    "error": "session_mismatch",
-                    "message": "Session does not match token"
-                }
-            )
+            raise HTTPException(status_code=401, detail=SESSION_MISMATCH_DETAIL)
         
         return {"user_id": user_id, "session_id": session_id}
         
     except JWTError:
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "invalid_token",
-                "message": "Could not validate token"
-            }
-        )
+        raise HTTPException(status_code=401, detail=INVALID_TOKEN_DETAIL)
 
 class SessionValidateRequest(BaseModel):
     user_id: str
     device_id: str
 
-class SessionValidateResponse(BaseModel):
-    session_id: str
-    jwt_token: str
-    expires_in: int = 86400  # 24 hours
-    user: dict
-
 @app.post("/api/v1/sessions/validate")
 async def validate_session(
     request: SessionValidateRequest,
     x_mock_error: Optional[str] = Header(None)
 ):
     """Validate user and create session with JWT"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     if x_mock_error == "invalid-member":
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "user_not_found",
-                "message": f"User {request.user_id} not found"
-            }
-        )
+        raise HTTPException(status_code=404, detail=user_not_found_detail(request.user_id))
     
-    if request.user_id not in users_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "user_not_found",
-                "message": f"User {request.user_id} not found"
-            }
-        )
-    
-    user = users_data[request.user_id]
+    user = users_data.get(request.user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail=user_not_found_detail(request.user_id))
     
     # Create session
-    session_id = f"sess_{uuid.uuid4().hex[:16]}"
+    session_id = f"sess_{secrets.token_hex(8)}"
+    now = time.time()
     active_sessions[session_id] = {
         "user_id": request.user_id,
         "device_id": request.device_id,
-        "created_at": datetime.utcnow().isoformat(),
-        "expires_at": (datetime.utcnow() + timedelta(hours=24)).isoformat()
+        "created_at": datetime.utcfromtimestamp(now).isoformat(),
+        "expires_at": int(now) + SESSION_TTL  # epoch seconds
     }
     
     # Create JWT
     jwt_token = create_jwt_token(request.user_id, session_id)
     
-    return SessionValidateResponse(
-        session_id=session_id,
-        jwt_token=jwt_token,
-        user={
+    return ORJSONResponse({
+        "session_id": session_id,
+        "jwt_token": jwt_token,
+        "expires_in": SESSION_TTL,
+        "user": {
             "user_id": request.user_id,
             "name": user["name"],
             "email": user["email"],
             "status": user["status"]
         }
-    )
-
-class CoinsBalance(BaseModel):
-    user_id: str
-    coins: float
-    cashback_rate: float
-    total_cashback: float
-    currency: str = "USD"
+    })
 
 @app.get("/api/v1/users/{user_id}/coins")
 async def get_user_coins(
@@ -251,48 +296,28 @@ async def get_user_coins(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Get user's coin balance"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     # Verify user matches token
     if token_data["user_id"] != user_id:
-        raise HTTPException(
-            status_code=403,
-            detail={
-                "error": "forbidden",
-                "message": "Cannot access other user's data"
-            }
-        )
+        raise HTTPException(status_code=403, detail=FORBIDDEN_OTHER_USER_DETAIL)
     
-    if user_id not in users_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "user_not_found",
-                "message": f"User {user_id} not found"
-            }
-        )
-    
-    user = users_data[user_id]
-    return CoinsBalance(
-        user_id=user_id,
-        coins=user["coins"],
-        cashback_rate=user["cashback_rate"],
-        total_cashback=user["total_cashback"]
-    )
+    user = users_data.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail=user_not_found_detail(user_id))
+    return {
+        "user_id": user_id,
+        "coins": user["coins"],
+        "cashback_rate": user["cashback_rate"],
+        "total_cashback": user["total_cashback"],
+        "currency": "USD"
+    }
 
 class DeductCoinsRequest(BaseModel):
     amount: float
     reference_id: str
     description: str
 
-class DeductCoinsResponse(BaseModel):
-    transaction_id: str
-    user_id: str
-    amount_deducted: float
-    cashback_earned: float
-    remaining_coins: float
-    timestamp: str
-
 @app.post("/api/v1/users/{user_id}/coins/deduct")
 async def deduct_coins(
     user_id: str,
@@ -301,7 +326,7 @@ async def deduct_coins(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Deduct coins and calculate cashback"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     if x_mock_error == "insufficient-balance":
         raise HTTPException(
@@ -316,25 +341,14 @@ async def deduct_coins(
     
     # Verify user matches token
     if token_data["user_id"] != user_id:
-        raise HTTPException(
-            status_code=403,
-            detail={
-                "error": "forbidden",
-                "message": "Cannot access other user's data"
-            }
-        )
-    
-    if user_id not in users_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "user_not_found",
-                "message": f"User {user_id} not found"
-            }
-        )
+        raise HTTPException(status_code=403, detail=FORBIDDEN_OTHER_USER_DETAIL)
     
-    user = users_data[user_id]
+    user = users_data.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail=user_not_found_detail(user_id))
     
+    # No await from here to the response: on the single event loop this
+    # check-then-update cannot interleave with other requests or reset_data()
     if user["coins"] < request.amount:
         raise HTTPException(
             status_code=400,
@@ -354,7 +368,8 @@ async def deduct_coins(
     user["coins"] += cashback  # Add cashback immediately
     user["total_cashback"] += cashback
     
-    transaction_id = f"fatxn_{uuid.uuid4().hex[:12]}"
+    transaction_id = f"fatxn_{secrets.token_hex(6)}"
+    timestamp = datetime.utcnow().isoformat()
     
     # Log deduction for potential refund
     deductions_log[transaction_id] = {
@@ -362,17 +377,17 @@ async def deduct_coins(
         "amount": request.amount,
         "cashback": cashback,
         "reference_id": request.reference_id,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": timestamp
     }
     
-    return DeductCoinsResponse(
-        transaction_id=transaction_id,
-        user_id=user_id,
-        amount_deducted=request.amount,
-        cashback_earned=cashback,
-        remaining_coins=user["coins"],
-        timestamp=datetime.utcnow().isoformat()
-    )
+    return ORJSONResponse({
+        "transaction_id": transaction_id,
+        "user_id": user_id,
+        "amount_deducted": request.amount,
+        "cashback_earned": cashback,
+        "remaining_coins": user["coins"],
+        "timestamp": timestamp
+    })
 
 class WebhookValidationRequest(BaseModel):
     webhook_url: str
@@ -389,10 +404,10 @@ async def validate_webhook(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Validate webhook endpoint (for testing)"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     # Simple validation - in real implementation would test the webhook
-    webhook_id = f"whk_{uuid.uuid4().hex[:12]}"
+    webhook_id = f"whk_{secrets.token_hex(6)}"
     
     return WebhookValidationResponse(
         validated=True,
@@ -410,4 +425,4 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8003)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8003, loop="uvloop", http="httptools")
\ No newline at end of file
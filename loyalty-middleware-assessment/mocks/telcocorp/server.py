@@ -1,17 +1,26 @@
-from fastapi import FastAPI, HTTPException, Header, Request, Depends
+from fastapi import FastAPI, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional
+from datetime import datetime
+from functools import lru_cache
+import asyncio
+import copy
 import logging
-import uuid
+import time
 import secrets
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="TelcoCorp API Mock", version="1.0.0")
+app = FastAPI(
+    title="TelcoCorp API Mock",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,15 +30,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger bodies; the typical small JSON responses pass through as-is
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 security = HTTPBearer()
 
 # OAuth credentials
 CLIENT_ID = "telcocorp_client_id"
 CLIENT_SECRET = "telcocorp_client_secret"
+TOKEN_TTL = 3600  # seconds
 
-# In-memory storage for tokens and customers
+# Issued OAuth tokens (resets hourly)
 tokens = {}
-customers_data = {
+
+# Initial customer state, restored on every hourly reset
+_INITIAL_CUSTOMERS = {
     "TC-ABC123": {
         "name": "Alice Johnson",
         "email": "alice.j@email.com",
@@ -56,88 +71,139 @@ customers_data = {
     }
 }
 
+# In-memory storage for customers (resets hourly)
+customers_data = copy.deepcopy(_INITIAL_CUSTOMERS)
+
 # Track point usage for refunds
 usage_log = {}
 
-# Track last reset time
-last_reset = datetime.utcnow()
-
-def reset_data_if_needed():
-    """Reset data every hour"""
-    global last_reset, customers_data, usage_log, tokens
-    if datetime.utcnow() - last_reset > timedelta(hours=1):
-        customers_data = {
-            "TC-ABC123": {"name": "Alice Johnson", "email": "alice.j@email.com", "points": 25000, "status": "active", "tier": "gold", "travel_eligible": True},
-            "TC-DEF456": {"name": "David Brown", "email": "david.b@email.com", "points": 150000, "status": "active", "tier": "platinum", "travel_eligible": True},
-            "TC-GHI789": {"name": "Emma Wilson", "email": "emma.w@email.com", "points": 5000, "status": "active", "tier": "silver", "travel_eligible": True}
-        }
-        usage_log = {}
-        tokens = {}
-        last_reset = datetime.utcnow()
-        logger.info("Data reset completed")
-
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests and add rate limit headers"""
-    reset_data_if_needed()
-    
-    logger.info(f"{request.method} {request.url.path}")
-    response = await call_next(request)
-    
-    # Add rate limit headers
-    response.headers["X-RateLimit-Limit"] = "50"
-    response.headers["X-RateLimit-Remaining"] = "45"
-    response.headers["X-RateLimit-Reset"] = str(int((datetime.utcnow() + timedelta(minutes=1)).timestamp()))
-    
-    return response
+RESET_INTERVAL = 3600  # seconds
+
+def reset_data():
+    """Restore the initial in-memory state"""
+    customers_data.clear()
+    customers_data.update(copy.deepcopy(_INITIAL_CUSTOMERS))
+    usage_log.clear()
+    tokens.clear()
+    logger.info("Data reset completed")
+
+async def reset_data_periodically():
+    """Reset data every hour, off the request path"""
+    while True:
+        await asyncio.sleep(RESET_INTERVAL)
+        reset_data()
+
+_reset_task = None
+
+@app.on_event("startup")
+async def start_reset_task():
+    global _reset_task
+    _reset_task = asyncio.create_task(reset_data_periodically())
+
+@app.on_event("shutdown")
+async def stop_reset_task():
+    if _reset_task is not None:
+        _reset_task.cancel()
+
+# Static HTTPException details, shared read-only across requests (exceptions
+# themselves are raised fresh: re-raising one instance grows its traceback)
+SIMULATED_ERROR_DETAIL = {"error": "internal_error", "message": "Simulated error for testing"}
+AUTH_FAILED_DETAIL = {"error": "unauthorized", "message": "Authentication failed"}
+INVALID_TOKEN_DETAIL = {"error": "invalid_token", "message": "Invalid or expired token"}
+TOKEN_EXPIRED_DETAIL = {"error": "token_expired", "message": "Token has expired"}
+UNSUPPORTED_GRANT_TYPE_DETAIL = {"error": "unsupported_grant_type", "message": "Only client_credentials grant type is supported"}
+INVALID_CLIENT_DETAIL = {"error": "invalid_client", "message": "Invalid client credentials"}
+
+@lru_cache(maxsize=256)
+def customer_not_found_detail(customer_id: str) -> dict:
+    """404 detail for an unknown customer, built once per ID"""
+    return {
+        "error": "customer_not_found",
+        "message": f"Customer {customer_id} not found"
+    }
+
+# Static rate limit headers, appended to every response
+RATE_LIMIT_HEADERS = [
+    (b"x-ratelimit-limit", b"50"),
+    (b"x-ratelimit-remaining", b"45"),
+]
+
+_reset_second = 0
+_reset_header = b""
+
+def rate_limit_reset_header() -> bytes:
+    """Epoch seconds one minute from now, re-encoded at most once per second"""
+    global _reset_second, _reset_header
+    now = int(time.time())
+    if now != _reset_second:
+        _reset_second = now
+        _reset_header = str(now + 60).encode("latin-1")
+    return _reset_header
+
+class RateLimitHeadersMiddleware:
+    """Log all requests and add rate limit and response time headers in one pass"""
+
+    def __init__(self, app):
+        self.app = app
 
-def check_mock_error(x_mock_error: Optional[str] = Header(None)):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        # Logged as 500 if the app raises before sending a response
+        status = 500
+
+        async def send_with_headers(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *RATE_LIMIT_HEADERS,
+                    (b"x-ratelimit-reset", rate_limit_reset_header()),
+                    (b"x-response-time", f"{elapsed_ms:.1f}ms".encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(f"{scope['method']} {scope['path']} {status} {elapsed_ms:.1f}ms")
+
+app.add_middleware(RateLimitHeadersMiddleware)
+
+# X-Mock-Error values that fail the request outright -> (status, detail)
+MOCK_ERRORS = {
+    "true": (500, SIMULATED_ERROR_DETAIL),
+    "auth-failed": (401, AUTH_FAILED_DETAIL),
+}
+
+async def check_mock_error(x_mock_error: Optional[str] = Header(None)):
     """Simulate errors for testing"""
-    if x_mock_error == "true":
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "internal_error",
-                "message": "Simulated error for testing"
-            }
-        )
-    elif x_mock_error == "auth-failed":
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "unauthorized",
-                "message": "Authentication failed"
-            }
-        )
-    elif x_mock_error == "api-timeout":
-        import time
-        time.sleep(35)
+    if x_mock_error is None:
+        return
+    error = MOCK_ERRORS.get(x_mock_error)
+    if error is not None:
+        raise HTTPException(status_code=error[0], detail=error[1])
+    if x_mock_error == "api-timeout":
+        await asyncio.sleep(35)  # Simulate timeout without blocking the loop
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify OAuth token"""
     token = credentials.credentials
     
-    if token not in tokens:
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "invalid_token",
-                "message": "Invalid or expired token"
-            }
-        )
-    
-    token_data = tokens[token]
+    token_data = tokens.get(token)
+    if token_data is None:
+        raise HTTPException(status_code=401, detail=INVALID_TOKEN_DETAIL)
     
     # Check if token is expired
-    if datetime.utcnow() > token_data["expires_at"]:
+    if time.time() > token_data["expires_at"]:
         del tokens[token]
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "token_expired",
-                "message": "Token has expired"
-            }
-        )
+        raise HTTPException(status_code=401, detail=TOKEN_EXPIRED_DETAIL)
     
     return token_data
 
@@ -159,29 +225,17 @@ async def get_oauth_token(
     x_mock_error: Optional[str] = Header(None)
 ):
     """OAuth 2.0 token endpoint"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     if request.grant_type != "client_credentials":
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "unsupported_grant_type",
-                "message": "Only client_credentials grant type is supported"
-            }
-        )
+        raise HTTPException(status_code=400, detail=UNSUPPORTED_GRANT_TYPE_DETAIL)
     
     if request.client_id != CLIENT_ID or request.client_secret != CLIENT_SECRET:
-        raise HTTPException(
-            status_code=401,
-            detail={
-                "error": "invalid_client",
-                "message": "Invalid client credentials"
-            }
-        )
+        raise HTTPException(status_code=401, detail=INVALID_CLIENT_DETAIL)
     
     # Generate token
     token = f"tc_token_{secrets.token_urlsafe(32)}"
-    expires_at = datetime.utcnow() + timedelta(hours=1)
+    expires_at = int(time.time()) + TOKEN_TTL  # epoch seconds
     
     tokens[token] = {
         "expires_at": expires_at,
@@ -191,16 +245,10 @@ async def get_oauth_token(
     
     return TokenResponse(
         access_token=token,
-        expires_in=3600,
+        expires_in=TOKEN_TTL,
         scope=request.scope or "points:read points:use"
     )
 
-class PointsBalance(BaseModel):
-    customer_id: str
-    points: int
-    tier: str
-    status: str
-
 @app.get("/api/v2/customers/{customer_id}/points")
 async def get_customer_points(
     customer_id: str,
@@ -208,24 +256,17 @@ async def get_customer_points(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Get customer's points balance"""
-    check_mock_error(x_mock_error)
-    
-    if customer_id not in customers_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "customer_not_found",
-                "message": f"Customer {customer_id} not found"
-            }
-        )
+    await check_mock_error(x_mock_error)
     
-    customer = customers_data[customer_id]
-    return PointsBalance(
-        customer_id=customer_id,
-        points=customer["points"],
-        tier=customer["tier"],
-        status=customer["status"]
-    )
+    customer = customers_data.get(customer_id)
+    if customer is None:
+        raise HTTPException(status_code=404, detail=customer_not_found_detail(customer_id))
+    return {
+        "customer_id": customer_id,
+        "points": customer["points"],
+        "tier": customer["tier"],
+        "status": customer["status"]
+    }
 
 class UsePointsRequest(BaseModel):
     points: int
@@ -233,13 +274,6 @@ class UsePointsRequest(BaseModel):
     description: str
     travel_class: str = "economy"
 
-class UsePointsResponse(BaseModel):
-    transaction_id: str
-    customer_id: str
-    points_used: int
-    remaining_points: int
-    timestamp: str
-
 @app.post("/api/v2/customers/{customer_id}/points/use")
 async def use_customer_points(
     customer_id: str,
@@ -248,7 +282,7 @@ async def use_customer_points(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Use customer points for booking"""
-    check_mock_error(x_mock_error)
+    await check_mock_error(x_mock_error)
     
     if x_mock_error == "insufficient-balance":
         raise HTTPException(
@@ -272,17 +306,12 @@ async def use_customer_points(
             }
         )
     
-    if customer_id not in customers_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "customer_not_found",
-                "message": f"Customer {customer_id} not found"
-            }
-        )
-    
-    customer = customers_data[customer_id]
+    customer = customers_data.get(customer_id)
+    if customer is None:
+        raise HTTPException(status_code=404, detail=customer_not_found_detail(customer_id))
     
+    # No await from here to the response: on the single event loop this
+    # check-then-update cannot interleave with other requests or reset_data()
     if customer["points"] < request.points:
         raise HTTPException(
             status_code=400,
@@ -296,29 +325,24 @@ async def use_customer_points(
     
     # Use points
     customer["points"] -= request.points
-    transaction_id = f"tctxn_{uuid.uuid4().hex[:12]}"
+    transaction_id = f"tctxn_{secrets.token_hex(6)}"
+    timestamp = datetime.utcnow().isoformat()
     
     # Log usage for potential refund
     usage_log[transaction_id] = {
         "customer_id": customer_id,
         "points": request.points,
         "reference_id": request.reference_id,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": timestamp
     }
     
-    return UsePointsResponse(
-        transaction_id=transaction_id,
-        customer_id=customer_id,
-        points_used=request.points,
-        remaining_points=customer["points"],
-        timestamp=datetime.utcnow().isoformat()
-    )
-
-class TravelEligibility(BaseModel):
-    customer_id: str
-    eligible: bool
-    allowed_classes: list[str]
-    restrictions: Optional[list[str]]
+    return ORJSONResponse({
+        "transaction_id": transaction_id,
+        "customer_id": customer_id,
+        "points_used": request.points,
+        "remaining_points": customer["points"],
+        "timestamp": timestamp
+    })
 
 @app.get("/api/v2/customers/{customer_id}/travel/eligibility")
 async def check_travel_eligibility(
@@ -327,25 +351,18 @@ async def check_travel_eligibility(
     x_mock_error: Optional[str] = Header(None)
 ):
     """Check customer's travel eligibility and restrictions"""
-    check_mock_error(x_mock_error)
-    
-    if customer_id not in customers_data:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": "customer_not_found",
-                "message": f"Customer {customer_id} not found"
-            }
-        )
+    await check_mock_error(x_mock_error)
     
-    customer = customers_data[customer_id]
+    customer = customers_data.get(customer_id)
+    if customer is None:
+        raise HTTPException(status_code=404, detail=customer_not_found_detail(customer_id))
     
-    return TravelEligibility(
-        customer_id=customer_id,
-        eligible=customer["travel_eligible"],
-        allowed_classes=["economy"],  # TelcoCorp only allows economy
-        restrictions=["Economy class only", "No upgrades available"]
-    )
+    return {
+        "customer_id": customer_id,
+        "eligible": customer["travel_eligible"],
+        "allowed_classes": ["economy"],  # TelcoCorp only allows economy
+        "restrictions": ["Economy class only", "No upgrades available"]
+    }
 
 @app.get("/health")
 async def health_check():
@@ -358,4 +375,4 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8002)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8002, loop="uvloop", http="httptools")
\ No newline at end of file